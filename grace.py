@@ -5,10 +5,12 @@ import json
 import time
 import torch
 import logging
+import torch.nn.functional as F
 import numpy as np
 import nibabel as nib
+from concurrent.futures import ThreadPoolExecutor
 from monai.networks.nets import UNETR
-from monai.inferers import sliding_window_inference
+from monai.data.utils import compute_importance_map, dense_patch_slices
 from monai.data import MetaTensor, DataLoader, Dataset, load_decathlon_datalist
 from monai.transforms import Compose, Spacingd, Orientationd, ClipIntensityPercentilesd, ScaleIntensityRanged, EnsureTyped, LoadImaged, EnsureChannelFirstd, CropForegroundd, LambdaD, Resized, MapTransform
 
@@ -25,6 +27,15 @@ logging.basicConfig(
 
 logger=logging.getLogger(__name__)
 
+# Patch size is fixed, so let cuDNN benchmark and cache the fastest conv algorithms
+torch.backends.cudnn.benchmark = True
+
+# GRACE_QUIET=1 turns send_progress into a no-op when embedded in a larger pipeline
+_QUIET = os.environ.get("GRACE_QUIET") == "1"
+
+# Loaded models keyed by (model_path, spatial_size, num_classes, device, compile_model, quantize), reused across calls
+_MODEL_CACHE = {}
+
 
 # HOW TO USE:
 # logger.info("Created output directories.")
@@ -37,6 +48,8 @@ def send_progress(message, progress):
     """
     # data = json.dumps({"message": message, "progress": progress})
     # return f"data: {data}\n\n"
+    if _QUIET:
+        return
     if progress != ".":
         logger.info(f"{message}... {progress}%")
     else:
@@ -54,7 +67,7 @@ def generate_datalist(folder_path):
     with open("datalist.json", "w") as f:
         json.dump(datalist, f, indent=4)
 
-def load_model(model_path, spatial_size, num_classes, device, dataparallel=False, num_gpu=1):
+def load_model(model_path, spatial_size, num_classes, device, dataparallel=False, num_gpu=1, compile_model=False, quantize=False):
     """
         Load and configure the model for inference.
         @param model_path: Path to the model weights file (str)
@@ -63,8 +76,15 @@ def load_model(model_path, spatial_size, num_classes, device, dataparallel=False
         @param device: Device to run the model on (str or torch.device)
         @param dataparallel: Whether to use DataParallel (bool)
         @param num_gpu: Number of GPUs to use if dataparallel is True (int)
+        @param compile_model: Whether to compile the model with torch.compile on CUDA (bool)
+        @param quantize: Whether to quantize the ViT Linear layers to INT8 when running on CPU (bool)
         @return: Configured model for inference (torch.nn.Module)
     """
+    cache_key = (model_path, tuple(spatial_size), num_classes, str(device), compile_model, quantize)
+    if cache_key in _MODEL_CACHE:
+        send_progress("Using cached model", 40)
+        return _MODEL_CACHE[cache_key]
+
     send_progress("Configuring model", 10)
 
     model = UNETR(
@@ -88,14 +108,121 @@ def load_model(model_path, spatial_size, num_classes, device, dataparallel=False
     model = model.to(device)
     send_progress(f"Loading model weights from {model_path}", 20)
     
-    state_dict = torch.load(model_path, map_location=device, weights_only=True)
-    state_dict = {k.replace("module.", ""): v for k, v in state_dict.items()}
+    # Memory-map the checkpoint on the host; load_state_dict copies it straight into the device weights
+    state_dict = torch.load(model_path, map_location="cpu", weights_only=True, mmap=True)
+    # Only rebuild the dict for checkpoints saved from DataParallel
+    if any(k.startswith("module.") for k in state_dict):
+        state_dict = {k.removeprefix("module."): v for k, v in state_dict.items()}
     model.load_state_dict(state_dict, strict=False)
     model.eval()
+    if torch.device(device).type == "cuda":
+        # NDHWC lets cuDNN pick Tensor-Core 3D conv kernels without transposing (feature_size=16 keeps channels 8-aligned)
+        model = model.to(memory_format=torch.channels_last_3d)
+        if compile_model:
+            # Every window has the same shape, so CUDA graphs ("reduce-overhead") can replay the
+            # whole forward instead of launching each kernel; compiling only pays off over many windows
+            send_progress("Enabling torch.compile (compiles during the first inference)", 35)
+            model = torch.compile(model, mode="reduce-overhead", fullgraph=False, dynamic=False)
+    elif torch.device(device).type == "cpu" and quantize:
+        # Dynamic INT8 for the ViT attention/MLP Linear layers, which dominate CPU time; convs stay FP32
+        send_progress("Quantizing model to INT8 for CPU inference", 35)
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    _MODEL_CACHE[cache_key] = model
     
     send_progress("Model loaded successfully.", 40)
     return model
 
+def default_sw_batch_size(device, spatial_size, num_classes, max_batch_size=32):
+    """
+        Pick how many sliding windows to run per forward pass from the currently free GPU memory.
+        Call once the model and input volume are resident so they are already accounted for.
+        @param device: Device the model runs on (str or torch.device)
+        @param spatial_size: Size of each sliding window (tuple)
+        @param num_classes: Number of output classes (int)
+        @param max_batch_size: Upper bound on windows per forward pass (int)
+        @return: Number of windows per forward pass (int)
+    """
+    if torch.device(device).type != "cuda":
+        return 4
+    # Rough per-window footprint: UNETR keeps several 16-32 channel full-resolution decoder maps
+    # alive at once (some FP32 for instance norm), ~800 bytes per voxel, plus the class logits
+    window_bytes = int(np.prod(spatial_size)) * (800 + 4 * num_classes)
+    free_memory, _ = torch.cuda.mem_get_info(torch.device(device).index)
+    # Keep half of the free memory as headroom for the label/confidence maps and fragmentation
+    return max(1, min(max_batch_size, free_memory // 2 // window_bytes))
+
+def max_softmax(logits):
+    """
+        Per-voxel winning class and its softmax probability, without materializing the full softmax.
+        Works in the logits' own dtype (FP16 under autocast) and only accumulates the denominator in FP32.
+        @param logits: Per-class logits of shape (N, C, D, H, W) (torch.Tensor)
+        @return: Max probabilities (N, D, H, W) as float32 and labels (N, D, H, W) as uint8 (tuple)
+    """
+    # autocast would run exp/sum in FP32 and allocate full-class FP32 temporaries
+    with torch.autocast(device_type=logits.device.type, enabled=False):
+        max_logit, labels = logits.max(dim=1)
+        # max softmax = 1 / sum(exp(logits - max_logit)); every term is in (0, 1] so FP16 is safe
+        probs = 1.0 / torch.exp(logits - max_logit.unsqueeze(1)).sum(dim=1, dtype=torch.float32)
+    return probs, labels.to(torch.uint8)
+
+def sliding_window_argmax(inputs, roi_size, sw_batch_size, predictor, overlap=0.25, mode="constant", sigma_scale=0.125,
+                          pad_last_batch=False):
+    """
+        Sliding window inference that only keeps a running label map per voxel.
+        Instead of summing per-class logits into a (B, C, D, H, W) buffer, each window's
+        softmax confidence is compared against the best seen so far and the winning class is kept.
+        @param inputs: Input images of shape (B, 1, D, H, W) (torch.Tensor)
+        @param roi_size: Spatial size of each window (tuple)
+        @param sw_batch_size: Number of windows to run per predictor call (int)
+        @param predictor: Model returning per-class logits for a batch of windows (callable)
+        @param overlap: Overlap fraction between neighbouring windows (float)
+        @param mode: Window weighting, "constant" or "gaussian" to trust window centres more (str)
+        @param sigma_scale: Gaussian sigma as a fraction of the window size (float)
+        @param pad_last_batch: Pad the last window batch to sw_batch_size so a compiled predictor sees one shape (bool)
+        @return: Label map of shape (B, D, H, W) (torch.Tensor, uint8)
+    """
+    batch_size = inputs.shape[0]
+    image_size = inputs.shape[2:]
+
+    # Pad symmetrically so every spatial dim is at least one window wide
+    pad_before = [max(r - d, 0) // 2 for d, r in zip(image_size, roi_size)]
+    pad = []
+    for d, r, before in reversed(list(zip(image_size, roi_size, pad_before))):
+        pad.extend([before, max(r - d, 0) - before])
+    if any(pad):
+        inputs = F.pad(inputs, pad)
+    padded_size = inputs.shape[2:]
+
+    scan_interval = [r if r == d else max(int(r * (1 - overlap)), 1) for d, r in zip(padded_size, roi_size)]
+    slices = dense_patch_slices(tuple(padded_size), roi_size, scan_interval)
+
+    importance_map = compute_importance_map(roi_size, mode=mode, sigma_scale=sigma_scale, device=inputs.device)
+
+    label_map = torch.zeros((batch_size, *padded_size), dtype=torch.uint8, device=inputs.device)
+    # Start below any weighted confidence so the first window covering a voxel always wins
+    max_prob = torch.full((batch_size, *padded_size), -1.0, dtype=torch.float16, device=inputs.device)
+
+    for start in range(0, len(slices), sw_batch_size):
+        window_slices = slices[start:start + sw_batch_size]
+        windows = torch.cat([inputs[(slice(None), slice(None)) + tuple(w)] for w in window_slices])
+        num_windows = windows.shape[0]
+        if pad_last_batch and len(window_slices) < sw_batch_size:
+            # Pad the last batch with empty windows so every predictor call has the same shape;
+            # a compiled model would otherwise recompile and record a new CUDA graph per remainder
+            windows = F.pad(windows, [0, 0] * (windows.dim() - 1) + [0, (sw_batch_size - len(window_slices)) * batch_size])
+        probs, labels = max_softmax(predictor(windows)[:num_windows])
+        probs = (probs * importance_map).half()
+
+        for i, w in enumerate(window_slices):
+            region = (slice(None),) + tuple(w)
+            window_probs = probs[i * batch_size:(i + 1) * batch_size]
+            better = window_probs > max_prob[region]
+            max_prob[region] = torch.where(better, window_probs, max_prob[region])
+            label_map[region] = torch.where(better, labels[i * batch_size:(i + 1) * batch_size], label_map[region])
+
+    crop = (slice(None),) + tuple(slice(before, before + d) for before, d in zip(pad_before, image_size))
+    return label_map[crop]
+
 class ConditionalNormalizationd(MapTransform):
     def __init__(self, keys, a_min, a_max, complexity_threshold=10000, histogram_threshold=400):
         super().__init__(keys)
@@ -164,16 +291,17 @@ def preprocess_input(input_path, device, a_min_value, a_max_value, complexity_th
     """
     def normalize_fixed(data, a_min, a_max):
         data = np.clip(data, a_min, a_max)
-        return (data - a_min) / (a_max - a_min + 1e-8)
+        return ((data - a_min) / (a_max - a_min + 1e-8)).astype(np.float32, copy=False)
 
     def normalize_percentile(data, lower=20, upper=80):
         pmin, pmax = np.percentile(data, [lower, upper])
         data = np.clip(data, pmin, pmax)
-        return (data - pmin) / (pmax - pmin + 1e-8)
+        return ((data - pmin) / (pmax - pmin + 1e-8)).astype(np.float32, copy=False)
     
     send_progress(f"Loading input image from {input_path}", 30)
     input_img = nib.load(input_path)
-    image_data = input_img.get_fdata().astype(np.float32)
+    # Read straight into float32; get_fdata() would materialize (and cache) a float64 copy first
+    image_data = np.asarray(input_img.dataobj, dtype=np.float32)
     send_progress(f"Input image loaded. Shape: {image_data.shape}", 35)
     image_max = np.max(image_data)
     # image_min = np.min(image_data)
@@ -191,8 +319,13 @@ def preprocess_input(input_path, device, a_min_value, a_max_value, complexity_th
         image_data = normalize_fixed(image_data, a_min_value, a_max_value)
         send_progress(f"Applied fixed normalization (min: {a_min_value}, max: {a_max_value})", ".")
 
-    # Convert to MetaTensor for MONAI compatibility
-    meta_tensor = MetaTensor(image_data[np.newaxis, ...], affine=input_img.affine)
+    # Convert to MetaTensor for MONAI compatibility; placing it on the device makes
+    # Spacingd/Orientationd resample with grid_sample on the GPU instead of the CPU
+    host_tensor = torch.from_numpy(image_data[np.newaxis, ...])
+    if torch.device(device).type == "cuda":
+        # Pinned memory lets the upload run as an async DMA instead of blocking this thread
+        host_tensor = host_tensor.pin_memory()
+    meta_tensor = MetaTensor(host_tensor.to(device, non_blocking=True), affine=input_img.affine)
 
     send_progress("Applying preprocessing transforms", 40)
     
@@ -211,24 +344,27 @@ def preprocess_input(input_path, device, a_min_value, a_max_value, complexity_th
 
     transformed = test_transforms({"image": meta_tensor})
     # Convert to PyTorch tensor
-    image_tensor = transformed["image"].unsqueeze(0).to(device)
+    # Strip the MetaTensor wrapper (no copy) so window crops and the forward pass skip metadata tracking
+    image_tensor = transformed["image"].as_tensor().unsqueeze(0)
     send_progress(f"Preprocessing complete. Model input shape: {image_tensor.shape}", 45)
     return image_tensor, input_img
 
 def save_predictions(predictions, input_img, output_dir, base_filename, isniigz):
     """
-        Save predictions as NIfTI and MAT files.
-        @param predictions: Model output predictions (torch.Tensor)
+        Save predictions as a NIfTI file.
+        @param predictions: Predicted uint8 label map of shape (1, D, H, W) (torch.Tensor)
         @param input_img: Original input image used for predictions (nibabel Nifti1Image)
         @param output_dir: Directory to save the output files (str)
         @param base_filename: Base filename for the saved output files (str)
     """
     send_progress("Post-processing predictions", 80)
-    processed_preds = torch.argmax(predictions, dim=1).detach().cpu().numpy().squeeze()
+    processed_preds = predictions.squeeze().cpu().numpy()
     
     # Save as .nii.gz
     send_progress("Saving NIfTI file", 85)
     pred_img = nib.Nifti1Image(processed_preds, affine=input_img.affine, header=input_img.header)
+    # The copied input header carries the input dtype; store labels as uint8 instead
+    pred_img.set_data_dtype(np.uint8)
     if isniigz:
         nii_save_path = os.path.join(output_dir, f"{base_filename}_pred_GRACE.nii.gz")
     else:
@@ -239,18 +375,18 @@ def save_predictions(predictions, input_img, output_dir, base_filename, isniigz)
 
 def save_multiple_predictions(predictions, batch_meta, output_dir):
     """
-        Save predictions as NIfTI and MAT files.
-        @param predictions: Model output predictions (torch.Tensor)
-        @param input_img: Original input image used for predictions (nibabel Nifti1Image)
+        Save a batch of predictions as NIfTI files, one per input image.
+        @param predictions: Predicted uint8 label maps of shape (B, D, H, W) (torch.Tensor)
+        @param batch_meta: MetaTensor metadata of the input batch (dict)
         @param output_dir: Directory to save the output files (str)
-        @param base_filename: Base filename for the saved output files (str)
     """
     for i in range(predictions.shape[0]):
-        pred_np = torch.argmax(predictions[i], dim=0).cpu().numpy().squeeze()
+        pred_np = predictions[i].squeeze().cpu().numpy()
         isniigz = os.path.basename(batch_meta["filename_or_obj"][i]).endswith(".nii.gz")
         filename = os.path.basename(batch_meta["filename_or_obj"][i]).replace(".nii", "").replace(".gz","")
         affine = batch_meta["affine"][i].numpy()
-        header = nib.load(batch_meta["filename_or_obj"][i]).header
+        header = nib.load(batch_meta["filename_or_obj"][i]).header.copy()
+        header.set_data_dtype(np.uint8)
 
         # Save as .nii.gz
         send_progress(f"Processing outputs for input file - {filename}", ".")
@@ -262,7 +398,7 @@ def save_multiple_predictions(predictions, batch_meta, output_dir):
 
 def grace_predict_single_file(input_path, output_dir="output", model_path="./GRACE.pth",
                        spatial_size=(64, 64, 64), num_classes=12, dataparallel=False, num_gpu=1,
-                       a_min_value=0, a_max_value=255):
+                       a_min_value=0, a_max_value=255, overlap=0.25, sw_mode="gaussian", compile_model=False, sw_batch_size=None, quantize=False):
     """
         Predict segmentation for a single NIfTI image with progress updates via SSE.
         @param input_path: Path to the input NIfTI image file (str)
@@ -274,6 +410,11 @@ def grace_predict_single_file(input_path, output_dir="output", model_path="./GRA
         @param num_gpu: Number of GPUs to use if dataparallel is True (int)
         @param a_min_value: Minimum intensity value for scaling (int or float)
         @param a_max_value: Maximum intensity value for scaling (int or float)
+        @param overlap: Overlap fraction between sliding windows (float)
+        @param sw_mode: Sliding window weighting, "gaussian" or "constant" (str)
+        @param compile_model: Whether to compile the model with torch.compile on CUDA (bool)
+        @param sw_batch_size: Sliding windows per forward pass, derived from GPU memory if None (int)
+        @param quantize: Opt in to INT8 ViT Linear layers when falling back to CPU; outputs may differ from GPU runs (bool)
     """
     os.makedirs(output_dir, exist_ok=True)
     isniigz = os.path.basename(input_path).endswith(".nii.gz")
@@ -287,24 +428,39 @@ def grace_predict_single_file(input_path, output_dir="output", model_path="./GRA
     else:
         send_progress(f"Using device: {device}", 5)
 
-    # Load model
-    model = load_model(model_path, spatial_size, num_classes, device, dataparallel, num_gpu)
-
-    # Preprocess input
-    image_tensor, input_img = preprocess_input(input_path, device, a_min_value, a_max_value)
+    # Preprocess input in the background while the model is loaded; nibabel I/O and
+    # the MONAI resampling release the GIL, so a thread is enough to overlap the two
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        preprocess_future = executor.submit(preprocess_input, input_path, device, a_min_value, a_max_value)
+        model = load_model(model_path, spatial_size, num_classes, device, dataparallel, num_gpu, compile_model, quantize)
+        image_tensor, input_img = preprocess_future.result()
+    if device.type == "cuda":
+        image_tensor = image_tensor.contiguous(memory_format=torch.channels_last_3d)
+        torch.cuda.synchronize()
 
     # Perform inference
+    if sw_batch_size is None:
+        sw_batch_size = default_sw_batch_size(device, spatial_size, num_classes)
     send_progress("Starting sliding window inference", 50)
     start_time = time.time()
-    with torch.no_grad():
-        predictions = sliding_window_inference(
-            image_tensor, spatial_size, sw_batch_size=4, predictor=model, overlap=0.8
+    # FP16 autocast on CUDA so 3D conv/attention kernels run on Tensor Cores; weights stay FP32
+    with torch.inference_mode(), torch.autocast(device_type=device.type, dtype=torch.float16, enabled=device.type == "cuda"):
+        predictions = sliding_window_argmax(
+            image_tensor, spatial_size, sw_batch_size=sw_batch_size, predictor=model, overlap=overlap, mode=sw_mode,
+            pad_last_batch=compile_model and device.type == "cuda",
         )
     
     end_time = time.time()
     elapsed_time = end_time - start_time
     send_progress(f"Inference completed successfully in {elapsed_time:.2f} seconds.", 75)
 
+    # Labels are already uint8 (12 classes fit), so only the label map crosses PCIe; dropping the
+    # device copy here also frees the padded label map it views, along with the input volume
+    predictions = predictions.cpu()
+    del image_tensor
+    if device.type == "cuda":
+        torch.cuda.empty_cache()
+
     # Save predictions
     save_predictions(predictions, input_img, output_dir, base_filename, isniigz)
     
@@ -312,7 +468,7 @@ def grace_predict_single_file(input_path, output_dir="output", model_path="./GRA
 
 def grace_predict_multiple_files(input_path, output_dir="output", model_path="./GRACE.pth",
                        spatial_size=(64, 64, 64), num_classes=12, dataparallel=False, num_gpu=1,
-                       a_min_value=0, a_max_value=255):
+                       a_min_value=0, a_max_value=255, overlap=0.25, sw_mode="gaussian", compile_model=False, sw_batch_size=None, quantize=False):
     """
         Predict segmentation for a single NIfTI image with progress updates via SSE.
         @param input_path: Path to the input NIfTI image file (str)
@@ -324,6 +480,11 @@ def grace_predict_multiple_files(input_path, output_dir="output", model_path="./
         @param num_gpu: Number of GPUs to use if dataparallel is True (int)
         @param a_min_value: Minimum intensity value for scaling (int or float)
         @param a_max_value: Maximum intensity value for scaling (int or float)
+        @param overlap: Overlap fraction between sliding windows (float)
+        @param sw_mode: Sliding window weighting, "gaussian" or "constant" (str)
+        @param compile_model: Whether to compile the model with torch.compile on CUDA (bool)
+        @param sw_batch_size: Sliding windows per forward pass, derived from GPU memory if None (int)
+        @param quantize: Opt in to INT8 ViT Linear layers when falling back to CPU; outputs may differ from GPU runs (bool)
     """
     os.makedirs(output_dir, exist_ok=True)
     batch_size = 1
@@ -340,22 +501,39 @@ def grace_predict_multiple_files(input_path, output_dir="output", model_path="./
     dataset = Dataset(data=datalist, transform=transforms)
     dataloader = DataLoader(dataset, batch_size=batch_size, num_workers=1)
     # Load model
-    model = load_model(model_path, spatial_size, num_classes, device, dataparallel, num_gpu)
+    model = load_model(model_path, spatial_size, num_classes, device, dataparallel, num_gpu, compile_model, quantize)
 
     # Perform inference
     send_progress("Starting sliding window inference", 50)
-    for batch in dataloader:
-        images = batch["image"].to(device)
-        meta = batch["image"].meta
-        start_time = time.time()
-        with torch.no_grad():
-            preds = sliding_window_inference(
-                images, spatial_size, sw_batch_size=10, predictor=model, overlap=0.8
-            )
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        send_progress(f"Batch inference completed {elapsed_time:.2f} seconds",".")
-        save_multiple_predictions(preds, meta, output_dir)
+    # Write each batch's NIfTI files on a background thread while the next batch is inferred;
+    # nibabel's gzip writer (already compresslevel=1) releases the GIL
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        pending_saves = []
+        for batch in dataloader:
+            images = batch["image"].as_tensor().to(device)
+            if device.type == "cuda":
+                images = images.contiguous(memory_format=torch.channels_last_3d)
+            if sw_batch_size is None:
+                # Size from free memory once the model and the first volume are resident
+                sw_batch_size = default_sw_batch_size(device, spatial_size, num_classes)
+            meta = batch["image"].meta
+            start_time = time.time()
+            with torch.inference_mode(), torch.autocast(device_type=device.type, dtype=torch.float16, enabled=device.type == "cuda"):
+                preds = sliding_window_argmax(
+                    images, spatial_size, sw_batch_size=sw_batch_size, predictor=model, overlap=overlap, mode=sw_mode,
+                    pad_last_batch=compile_model and device.type == "cuda",
+                )
+            end_time = time.time()
+            elapsed_time = end_time - start_time
+            send_progress(f"Batch inference completed {elapsed_time:.2f} seconds",".")
+            # Copy the uint8 labels to the host here so the writer only does gzip and file I/O
+            # and no device memory is held across batches
+            pending_saves.append(writer.submit(save_multiple_predictions, preds.cpu(), meta, output_dir))
+            del images, preds
+
+        # Surface any write errors
+        for future in pending_saves:
+            future.result()
     
     send_progress("Processing completed successfully!", 99)
 
@@ -363,10 +541,16 @@ def grace_predict_multiple_files(input_path, output_dir="output", model_path="./
 if __name__ == "__main__":
     if(len(sys.argv) < 2):
         print("Path for input file or a folder expected!")
+        sys.exit(1)
     elif(len(sys.argv) > 3):
         print("Too many arguments...!")
+        sys.exit(1)
 
     input_path = sys.argv[1]
+    # Fail before loading the model rather than after a wasted inference
+    if not os.path.isdir(input_path) and not (os.path.isfile(input_path) and input_path.endswith((".nii", ".nii.gz"))):
+        print(f"Input {input_path} is neither a .nii/.nii.gz file nor a folder!")
+        sys.exit(1)
     output_dir = "outputs"
     model_path = "./GRACE.pth"
     datalist_path = "datalist.json"
@@ -384,7 +568,7 @@ if __name__ == "__main__":
             dataparallel=False,
             num_gpu=1,
             a_min_value=0,
-            a_max_value=255,    
+            a_max_value=255,
         )
     
     else: